@@ -1,27 +1,47 @@
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
+import pandas as pd
+import plotly.graph_objects as go
 from models import QuestionDataset, QuizGenerator, QuizCorrector
 
+# Above this many tags the topic multiselect is search-filtered and capped
+MAX_TAG_OPTIONS = 200
+
+# Custom CSS for better styling
+CUSTOM_CSS = """
+<style>
+    .main > div {
+        padding-top: 2rem;
+    }
+    h1 {
+        color: #1f77b4;
+    }
+    .stButton>button {
+        width: 100%;
+    }
+</style>
+"""
+
+
+@st.cache_resource
+def load_dataset(filepath):
+    """Load the question dataset once per process and reuse it across reruns."""
+    return QuestionDataset.from_json(filepath)
+
+
 class QuizView:
     """
     Handles all Streamlit rendering and user interactions.
     """
     def __init__(self, dataset):
         self.dataset = dataset
-        self.all_tags = dataset.get_all_tags()
+        self.all_tags = dataset.get_all_tags()  # sorted once at load time
         
         # Initialize session state
-        if 'quiz_generated' not in st.session_state:
-            st.session_state.quiz_generated = False
-        if 'questions' not in st.session_state:
-            st.session_state.questions = []
-        if 'user_answers' not in st.session_state:
-            st.session_state.user_answers = {}
-        if 'quiz_corrected' not in st.session_state:
-            st.session_state.quiz_corrected = False
-        if 'results' not in st.session_state:
-            st.session_state.results = None
+        st.session_state.setdefault('quiz_generated', False)
+        st.session_state.setdefault('questions', [])
+        st.session_state.setdefault('user_answers', {})
+        st.session_state.setdefault('quiz_corrected', False)
+        st.session_state.setdefault('results', None)
 
     def reset_quiz(self):
         """Reset all quiz-related session state."""
@@ -37,13 +57,16 @@ class QuizView:
         """Display field selection UI and return selected fields."""
         st.sidebar.header("📚 Quiz Configuration")
         
-        # Tag selection
-        selected_tags = st.sidebar.multiselect(
-            "Select Topics:",
-            options=self.all_tags,
-            default=None,
-            help="Select one or more topics. Leave empty to include all topics."
-        )
+        # Tag selection (search-filtered and capped for very large tag sets)
+        if len(self.all_tags) > MAX_TAG_OPTIONS:
+            selected_tags = self._select_tags_searchable()
+        else:
+            selected_tags = st.sidebar.multiselect(
+                "Select Topics:",
+                options=self.all_tags,
+                default=None,
+                help="Select one or more topics. Leave empty to include all topics."
+            )
         
         # Number of questions
         num_questions = st.sidebar.slider(
@@ -58,6 +81,31 @@ class QuizView:
         
         return selected_tags
 
+    def _select_tags_searchable(self):
+        """
+        Topic multiselect behind a search box, showing at most
+        MAX_TAG_OPTIONS matches.
+        """
+        query = st.sidebar.text_input("Search topics:").lower()
+        chosen = st.session_state.setdefault('chosen_tags', [])
+        matches = [t for t in self.all_tags if query in t.lower()][:MAX_TAG_OPTIONS]
+        
+        # Chosen topics stay in the options (in the dataset's sorted order) and
+        # are passed back as the default, so a new search or a rebuilt widget
+        # keeps the selection
+        visible = set(matches).union(chosen)
+        options = [t for t in self.all_tags if t in visible]
+        
+        chosen = st.sidebar.multiselect(
+            "Select Topics:",
+            options=options,
+            default=chosen,
+            help="Select one or more topics. Leave empty to include all topics."
+        )
+        st.session_state.chosen_tags = chosen
+        
+        return chosen
+
     def generate_quiz(self, selected_fields):
         """Generate a new quiz based on selected fields."""
         generator = QuizGenerator(self.dataset)
@@ -76,7 +124,6 @@ class QuizView:
         st.session_state.quiz_corrected = False
         st.session_state.results = None
         st.success(f"✓ Generated quiz with {len(questions)} questions!")
-        st.rerun()
 
     def show_quiz(self):
         """Display quiz questions and collect answers."""
@@ -90,88 +137,94 @@ class QuizView:
             return
         
         st.header("📝 Quiz Questions")
-        st.markdown("---")
         
         questions = st.session_state.questions
         
         for idx, question in enumerate(questions):
-            # Question container
-            with st.container():
-                col1, col2 = st.columns([0.95, 0.05])
-                
-                with col1:
-                    # Question header
-                    st.subheader(f"Question {idx + 1} of {len(questions)}")
-                    
-                    # Question type badge
-                    badge_color = "🔵" if question.mode == "single" else "🟢"
-                    st.markdown(f"{badge_color} **{question.mode.upper()} CHOICE**")
-                    
-                    # Question text
-                    st.markdown(f"**{question.question}**")
-                    
-                    # Answer options
-                    if question.mode == 'single':
-                        # Radio buttons for single choice
-                        answer = st.radio(
-                            "Select your answer:",
-                            options=question.choices,
-                            key=f"q_{idx}",
-                            index=None
-                        )
-                        st.session_state.user_answers[idx] = answer
-                    else:
-                        # Multiselect for multiple choice
-                        answers = st.multiselect(
-                            "Select all correct answers:",
-                            options=question.choices,
-                            key=f"q_{idx}",
-                            default=st.session_state.user_answers.get(idx, [])
-                        )
-                        st.session_state.user_answers[idx] = answers
-                
-                with col2:
-                    # Tags display
-                    st.caption("Tags:")
-                    for tag in question.tags:
-                        st.caption(f"🏷️ {tag}")
-                
-                st.markdown("---")
+            # Static parts (divider, header, type badge, text, tags) in one element
+            badge_color = "🔵" if question.mode == "single" else "🟢"
+            tags = " ".join(f"🏷️ {tag}" for tag in question.tags)
+            st.markdown(
+                f"---\n\n"
+                f"### Question {idx + 1} of {len(questions)}\n\n"
+                f"{badge_color} **{question.mode.upper()} CHOICE** · Tags: {tags}\n\n"
+                f"**{question.question}**"
+            )
+            
+            # Answer options
+            if question.mode == 'single':
+                # Radio buttons for single choice
+                answer = st.radio(
+                    "Select your answer:",
+                    options=question.choices,
+                    key=f"q_{idx}",
+                    index=None
+                )
+                st.session_state.user_answers[idx] = answer
+            else:
+                # Multiselect for multiple choice
+                answers = st.multiselect(
+                    "Select all correct answers:",
+                    options=question.choices,
+                    key=f"q_{idx}",
+                    default=st.session_state.user_answers.get(idx, [])
+                )
+                st.session_state.user_answers[idx] = answers
 
     def submit_and_correct(self):
-        """Submit quiz and show correction."""
+        """
+        Submit quiz and show correction.
+        Used as the submit button's on_click callback, so the state set here
+        is already visible to the run the click triggers. Messages are left in
+        session state and rendered next to the button by show_submit_message().
+        """
         if not st.session_state.quiz_generated:
-            st.warning("⚠️ Please generate a quiz first!")
+            st.session_state.submit_message = ('warning', "⚠️ Please generate a quiz first!")
             return
         
         if st.session_state.quiz_corrected:
-            st.info("Quiz already corrected! Reset to try again.")
+            st.session_state.submit_message = ('info', "Quiz already corrected! Reset to try again.")
             return
         
-        # Check if all questions are answered
+        # Read answers from the widgets themselves; user_answers is only
+        # refreshed by show_quiz and may lag behind a quick click
         questions = st.session_state.questions
+        user_answers = {}
         unanswered = []
         
         for idx, question in enumerate(questions):
-            answer = st.session_state.user_answers.get(idx)
             if question.mode == 'single':
+                answer = st.session_state.get(f"q_{idx}")
                 if answer is None:
                     unanswered.append(idx + 1)
             else:  # multiple
+                answer = st.session_state.get(f"q_{idx}", [])
                 if not answer:
                     unanswered.append(idx + 1)
+            user_answers[idx] = answer
+        
+        st.session_state.user_answers = user_answers
         
         if unanswered:
-            st.warning(f"⚠️ Please answer all questions! Unanswered: {', '.join(map(str, unanswered))}")
+            st.session_state.submit_message = (
+                'warning',
+                f"⚠️ Please answer all questions! Unanswered: {', '.join(map(str, unanswered))}"
+            )
             return
         
         # Correct the quiz
         corrector = QuizCorrector(questions)
-        results = corrector.correct_quiz(st.session_state.user_answers)
+        results = corrector.correct_quiz(user_answers)
         
         st.session_state.results = results
         st.session_state.quiz_corrected = True
-        st.rerun()
+
+    def show_submit_message(self):
+        """Render the message left by the last submit attempt, if any."""
+        message = st.session_state.pop('submit_message', None)
+        if message:
+            level, text = message
+            getattr(st, level)(text)
 
     def _show_results(self):
         """Display quiz results with visualizations."""
@@ -196,10 +249,9 @@ class QuizView:
             )
         
         with col3:
-            correct_count = sum(1 for d in results['details'] if d['is_correct'])
             st.metric(
                 "Correct Answers",
-                f"{correct_count} / {results['max_score']}"
+                f"{results['n_correct']} / {results['max_score']}"
             )
         
         # Performance message
@@ -222,168 +274,137 @@ class QuizView:
         # Detailed results
         st.subheader("📋 Detailed Results")
         
-        for detail in results['details']:
-            idx = detail['question_index']
-            question = st.session_state.questions[idx]
-            
-            # Color coding
-            if detail['is_correct']:
-                status = "✅"
-                color = "success"
-            else:
-                status = "❌"
-                color = "error"
-            
-            with st.expander(f"{status} Question {idx + 1} - Score: {detail['score']:.2f}/1.00"):
-                st.markdown(f"**{question.question}**")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**Your Answer(s):**")
-                    if question.mode == 'single':
-                        st.write(detail['user_answers'] or "No answer")
-                    else:
-                        st.write(", ".join(detail['user_answers']) if detail['user_answers'] else "No answers")
-                
-                with col2:
-                    st.markdown("**Correct Answer(s):**")
-                    st.write(", ".join(detail['correct_answers']))
-                
-                # Score breakdown for multiple choice
-                if question.mode == 'multiple' and not detail['is_correct']:
-                    st.caption(f"📊 Partial credit: {detail['score']:.2f} points")
+        # One virtualized table instead of a widget group per question
+        df = pd.DataFrame(results['details'])
+        df['question_index'] += 1
+        df['user_answers'] = [
+            (answer or "No answer") if mode == 'single' else (", ".join(answer) or "No answers")
+            for answer, mode in zip(df['user_answers'], df['mode'])
+        ]
+        df['correct_answers'] = df['correct_answers'].map(", ".join)
+        df['is_correct'] = df['is_correct'].map({True: "✅", False: "❌"})
+        
+        df = df[['question_index', 'question_text', 'user_answers', 'correct_answers', 'score', 'is_correct']]
+        df.columns = ['Q#', 'Question', 'Your Answer(s)', 'Correct Answer(s)', 'Score', '✓/✗']
+        
+        st.dataframe(
+            df,
+            width="stretch",
+            hide_index=True,
+            column_config={'Score': st.column_config.NumberColumn(format="%.2f")}
+        )
 
     def _show_visualizations(self, results):
         """Show charts and visualizations."""
         st.subheader("📈 Performance Analysis")
         
+        scores = [d['score'] for d in results['details']]
+        colors_per_q = ['#28a745' if s == 1.0 else '#ffc107' if s > 0 else '#dc3545' for s in scores]
+        
         # Create two columns for charts
         col1, col2 = st.columns(2)
         
         with col1:
             # Score distribution
-            fig1, ax1 = plt.subplots(figsize=(6, 4))
-            
-            scores = [d['score'] for d in results['details']]
-            correct_count = sum(1 for s in scores if s == 1.0)
-            partial_count = sum(1 for s in scores if 0 < s < 1.0)
-            incorrect_count = sum(1 for s in scores if s == 0)
-            
-            categories = ['Correct', 'Partial', 'Incorrect']
-            counts = [correct_count, partial_count, incorrect_count]
-            colors = ['#28a745', '#ffc107', '#dc3545']
-            
-            ax1.bar(categories, counts, color=colors, alpha=0.7, edgecolor='black')
-            ax1.set_ylabel('Number of Questions')
-            ax1.set_title('Answer Distribution')
-            ax1.set_ylim(0, max(counts) + 2)
+            counts = [results['n_correct'], results['n_partial'], results['n_incorrect']]
             
-            # Add count labels on bars
-            for i, (cat, count) in enumerate(zip(categories, counts)):
-                ax1.text(i, count + 0.1, str(count), ha='center', va='bottom', fontweight='bold')
+            fig1 = go.Figure(go.Bar(
+                x=['Correct', 'Partial', 'Incorrect'],
+                y=counts,
+                marker_color=['#28a745', '#ffc107', '#dc3545'],
+                text=counts,
+                textposition='outside'
+            ))
+            fig1.update_layout(
+                title='Answer Distribution',
+                yaxis_title='Number of Questions',
+                yaxis_range=[0, max(counts) + 2]
+            )
             
-            st.pyplot(fig1)
-            plt.close()
+            st.plotly_chart(fig1, use_container_width=True)
         
         with col2:
             # Score per question
-            fig2, ax2 = plt.subplots(figsize=(6, 4))
-            
-            question_nums = [d['question_index'] + 1 for d in results['details']]
-            scores = [d['score'] for d in results['details']]
-            
-            colors_per_q = ['#28a745' if s == 1.0 else '#ffc107' if s > 0 else '#dc3545' for s in scores]
-            
-            ax2.bar(question_nums, scores, color=colors_per_q, alpha=0.7, edgecolor='black')
-            ax2.set_xlabel('Question Number')
-            ax2.set_ylabel('Score')
-            ax2.set_title('Score per Question')
-            ax2.set_ylim(0, 1.1)
-            ax2.axhline(y=1.0, color='green', linestyle='--', alpha=0.3, label='Perfect Score')
-            ax2.legend()
+            fig2 = go.Figure(go.Bar(
+                x=[d['question_index'] + 1 for d in results['details']],
+                y=scores,
+                marker_color=colors_per_q
+            ))
+            fig2.add_hline(y=1.0, line_dash='dash', line_color='green', opacity=0.3)
+            fig2.update_layout(
+                title='Score per Question',
+                xaxis_title='Question Number',
+                yaxis_title='Score',
+                yaxis_range=[0, 1.1]
+            )
             
-            st.pyplot(fig2)
-            plt.close()
+            st.plotly_chart(fig2, use_container_width=True)
         
         # Overall performance pie chart
-        fig3, ax3 = plt.subplots(figsize=(6, 4))
-        
         percentage = results['percentage']
         remaining = 100 - percentage
         
-        colors_pie = ['#28a745', '#e0e0e0']
-        explode = (0.05, 0)
-        
-        ax3.pie([percentage, remaining], 
-                labels=['Score', 'Remaining'],
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors_pie,
-                explode=explode)
-        ax3.set_title('Overall Performance')
-        
-        st.pyplot(fig3)
-        plt.close()
+        fig3 = go.Figure(go.Pie(
+            labels=['Score', 'Remaining'],
+            values=[percentage, remaining],
+            marker=dict(colors=['#28a745', '#e0e0e0']),
+            pull=[0.05, 0],
+            sort=False,
+            textinfo='percent'
+        ))
+        fig3.update_layout(title='Overall Performance')
+        
+        st.plotly_chart(fig3, use_container_width=True)
 
 
 # --- STREAMLIT APP ENTRY POINT ---
-st.set_page_config(page_title="OOP Quiz Generator", layout="wide")
+def main():
+    """Render the app; Streamlit re-executes this on every rerun."""
+    st.set_page_config(page_title="OOP Quiz Generator", layout="wide")
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    h1 {
-        color: #1f77b4;
-    }
-    .stButton>button {
-        width: 100%;
-    }
-</style>
-""", unsafe_allow_html=True)
+    # Custom CSS for better styling
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+    st.title("🎓 Interactive OOP Quiz Generator")
+    st.markdown("*Test your knowledge across multiple topics!*")
 
-st.title("🎓 Interactive OOP Quiz Generator")
-st.markdown("*Test your knowledge across multiple topics!*")
+    # Load dataset (cached across reruns)
+    dataset = load_dataset("quiz_dataset.json")
+    quiz_view = QuizView(dataset)
 
-# Load dataset singleton
-dataset = QuestionDataset("quiz_dataset.json")
-quiz_view = QuizView(dataset)
+    # Sidebar controls
+    with st.sidebar:
+        st.title("⚙️ Controls")
 
-# Sidebar controls
-with st.sidebar:
-    st.title("⚙️ Controls")
-    
-    # Reset button
-    if st.button("🔄 Reset Quiz", use_container_width=True):
-        quiz_view.reset_quiz()
-    
-    st.markdown("---")
+        # Reset button
+        if st.button("🔄 Reset Quiz", use_container_width=True):
+            quiz_view.reset_quiz()
+
+        st.markdown("---")
 
-# Field selection
-selected_fields = quiz_view.select_fields()
+    # Field selection
+    selected_fields = quiz_view.select_fields()
 
-# Generate Quiz button
-if st.sidebar.button("🎲 Generate Quiz", use_container_width=True, type="primary"):
-    quiz_view.generate_quiz(selected_fields)
+    # Generate Quiz button
+    if st.sidebar.button("🎲 Generate Quiz", use_container_width=True, type="primary"):
+        quiz_view.generate_quiz(selected_fields)
 
-# Show Quiz
-quiz_view.show_quiz()
+    # Show Quiz
+    quiz_view.show_quiz()
+
+    # Submit & Correct Quiz button
+    if st.session_state.quiz_generated and not st.session_state.quiz_corrected:
+        st.markdown("---")
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.button(
+                "📤 Submit & Correct Quiz",
+                use_container_width=True,
+                type="primary",
+                on_click=quiz_view.submit_and_correct
+            )
+            quiz_view.show_submit_message()
 
-# Submit & Correct Quiz button
-if st.session_state.quiz_generated and not st.session_state.quiz_corrected:
-    st.markdown("---")
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("📤 Submit & Correct Quiz", use_container_width=True, type="primary"):
-            quiz_view.submit_and_correct()
 
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: gray; padding: 20px;'>
-    <p></p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
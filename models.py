@@ -1,5 +1,18 @@
 import json
 import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+try:
+    import orjson  # optional, faster JSON decoding for large datasets
+except ImportError:
+    orjson = None
+
+
+def _popcount(mask):
+    """Number of set bits in a non-negative int."""
+    return bin(mask).count('1')
+
 
 class Question:
     """
@@ -10,19 +23,79 @@ class Question:
     - mode: 'single' or 'multiple'.
     - tags: List of fields/tags for filtering.
     """
+    __slots__ = ('question', 'choices', 'correct', 'mode', 'tags',
+                 '_correct_first', '_correct_len',
+                 '_bit', '_correct_mask')
+
     def __init__(self, question, choices, correct, mode, tags):
         self.question = question
         self.choices = choices
         self.correct = correct
         self.mode = mode
         self.tags = tags
+        
+        self._correct_first = correct[0] if correct else None
+        
+        # One bit per choice so selections can be compared as integer masks;
+        # a correct answer missing from the choices still gets its own bit
+        self._bit = {}
+        for answer in list(choices) + list(correct):
+            self._bit.setdefault(answer, 1 << len(self._bit))
+        self._correct_mask, _ = self._mask(correct)
+        self._correct_len = _popcount(self._correct_mask)
+    
+    def _mask(self, answers):
+        """
+        Reduce a list of answers to a bitmask over this question's choices.
+        Returns (mask, number of distinct answers that aren't choices).
+        """
+        mask = 0
+        unknown = set()
+        for answer in answers:
+            bit = self._bit.get(answer)
+            if bit is None:
+                unknown.add(answer)
+            else:
+                mask |= bit
+        return mask, len(unknown)
+    
+    def _score_terms(self, selected_answers):
+        """
+        Return (correct selected, incorrect selected, number of correct answers).
+        A single choice question counts as one correct answer.
+        """
+        if self.mode == 'single':
+            hit = selected_answers == self._correct_first if selected_answers else False
+            return int(hit), 0, 1
+        
+        if not selected_answers:
+            return 0, 0, self._correct_len
+        
+        # Answers that aren't choices count as incorrect selections
+        selected_mask, unknown = self._mask(selected_answers)
+        correct_selected = _popcount(selected_mask & self._correct_mask)
+        incorrect_selected = _popcount(selected_mask & ~self._correct_mask) + unknown
+        return correct_selected, incorrect_selected, self._correct_len
+    
+    def score_and_check(self, selected_answers):
+        """
+        Score the selected answers and check them in a single pass.
+        Returns (score, is_correct).
+        """
+        correct_selected, incorrect_selected, correct_len = self._score_terms(selected_answers)
+        
+        # Calculate: (|correct ∩ selected| / |correct|) - (|selected - correct| / |correct|)
+        # A question without correct answers can't earn points
+        if correct_len == 0:
+            score = 0.0
+        else:
+            score = max(0.0, (correct_selected - incorrect_selected) / correct_len)
+        is_correct = correct_selected == correct_len and incorrect_selected == 0
+        return score, is_correct
     
     def is_correct(self, selected_answers):
         """Check if the selected answers are correct."""
-        if self.mode == 'single':
-            return selected_answers == self.correct[0] if selected_answers else False
-        else:  # multiple
-            return set(selected_answers) == set(self.correct)
+        return self.score_and_check(selected_answers)[1]
     
     def calculate_score(self, selected_answers):
         """
@@ -30,51 +103,40 @@ class Question:
         Single choice: 1 if correct, 0 otherwise
         Multiple choice: proportional score
         """
-        if self.mode == 'single':
-            return 1.0 if self.is_correct(selected_answers) else 0.0
-        else:
-            if not selected_answers:
-                return 0.0
-            
-            selected_set = set(selected_answers)
-            correct_set = set(self.correct)
-            
-            # Calculate: (|correct ∩ selected| / |correct|) - (|selected - correct| / |correct|)
-            correct_selected = len(selected_set & correct_set)
-            incorrect_selected = len(selected_set - correct_set)
-            
-            score = (correct_selected / len(correct_set)) - (incorrect_selected / len(correct_set))
-            return max(0.0, score)
+        return self.score_and_check(selected_answers)[0]
     
     def __repr__(self):
         return f"Question(question='{self.question[:30]}...', mode='{self.mode}', tags={self.tags})"
 
 
+@dataclass(frozen=True)
 class QuestionDataset:
     """
-    Singleton class to load quiz questions from a JSON file.
-    - Loads all questions as Question objects.
-    - Provides a method to get all unique tags for filtering.
+    Immutable set of quiz questions loaded from a JSON file.
+    - questions: Tuple of Question objects.
+    - tags: Sorted tuple of all unique tags for filtering.
+    - tag_index: Maps each tag to the indices of the questions carrying it.
+    Build it with QuestionDataset.from_json(); the app caches the result
+    with st.cache_resource so the file is parsed once per process.
     """
-    _instance = None
-    _questions = []
-    _all_tags = set()
-
-    def __new__(cls, filepath=None):
-        if cls._instance is None:
-            cls._instance = super(QuestionDataset, cls).__new__(cls)
-            if filepath:
-                cls._instance._load_questions(filepath)
-        return cls._instance
+    questions: tuple = ()
+    tags: tuple = ()
+    tag_index: dict = field(default_factory=dict, hash=False, compare=False, repr=False)
 
-    def _load_questions(self, filepath):
+    @classmethod
+    def from_json(cls, filepath):
         """Load questions from JSON file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
-            self._questions = []
-            for item in data:
+            questions = []
+            tag_index = defaultdict(list)
+            for idx, item in enumerate(data):
                 question = Question(
                     question=item['question'],
                     choices=item['choices'],
@@ -82,33 +144,43 @@ class QuestionDataset:
                     mode=item['mode'],
                     tags=item['tags']
                 )
-                self._questions.append(question)
-                self._all_tags.update(item['tags'])
+                questions.append(question)
+                for tag in item['tags']:
+                    tag_index[tag].append(idx)
             
-            print(f"✓ Loaded {len(self._questions)} questions with {len(self._all_tags)} unique tags")
+            dataset = cls(
+                questions=tuple(questions),
+                tags=tuple(sorted(tag_index)),
+                tag_index={tag: tuple(idxs) for tag, idxs in tag_index.items()}
+            )
+            print(f"✓ Loaded {len(dataset.questions)} questions with {len(dataset.tags)} unique tags")
+            return dataset
         except Exception as e:
             print(f"✗ Error loading questions: {e}")
-            self._questions = []
-            self._all_tags = set()
+            return cls()
     
     def get_all_questions(self):
         """Return all loaded questions."""
-        return self._questions
+        return self.questions
     
     def get_all_tags(self):
-        """Return all unique tags."""
-        return sorted(list(self._all_tags))
+        """Return all unique tags (sorted once at load time)."""
+        return self.tags
+    
+    def get_question_indices_by_tags(self, tags):
+        """Return the indices of questions matching any of the tags (OR logic)."""
+        if not tags:
+            return range(len(self.questions))
+        
+        idxs = set().union(*(self.tag_index.get(tag, ()) for tag in tags))
+        return sorted(idxs)
     
     def get_questions_by_tags(self, tags):
         """Filter questions by tags (OR logic)."""
         if not tags:
-            return self._questions
+            return self.questions
         
-        filtered = []
-        for q in self._questions:
-            if any(tag in q.tags for tag in tags):
-                filtered.append(q)
-        return filtered
+        return [self.questions[i] for i in self.get_question_indices_by_tags(tags)]
 
 
 class QuizGenerator:
@@ -129,18 +201,18 @@ class QuizGenerator:
         Returns:
             List of Question objects
         """
-        # Get filtered questions
-        if selected_tags:
-            available_questions = self.dataset.get_questions_by_tags(selected_tags)
-        else:
-            available_questions = self.dataset.get_all_questions()
+        # Get indices of matching questions (a range when no tags are selected)
+        available_idxs = self.dataset.get_question_indices_by_tags(selected_tags)
         
-        if not available_questions:
+        if not available_idxs:
             return []
         
-        # Randomly select questions
-        num_to_select = min(num_questions, len(available_questions))
-        selected_questions = random.sample(available_questions, num_to_select)
+        # Randomly select question indices, then map back to Question objects
+        num_to_select = min(num_questions, len(available_idxs))
+        selected_idxs = random.sample(available_idxs, num_to_select)
+        
+        all_questions = self.dataset.get_all_questions()
+        selected_questions = [all_questions[i] for i in selected_idxs]
         
         return selected_questions
 
@@ -166,15 +238,17 @@ class QuizCorrector:
             'total_score': 0.0,
             'max_score': len(self.questions),
             'percentage': 0.0,
+            'n_correct': 0,
+            'n_partial': 0,
+            'n_incorrect': 0,
             'details': []
         }
         
         for idx, question in enumerate(self.questions):
             selected = user_answers.get(idx, [] if question.mode == 'multiple' else None)
             
-            # Calculate score for this question
-            score = question.calculate_score(selected)
-            is_correct = question.is_correct(selected)
+            # Score and check this question in a single pass
+            score, is_correct = question.score_and_check(selected)
             
             detail = {
                 'question_index': idx,
@@ -188,6 +262,14 @@ class QuizCorrector:
             
             results['details'].append(detail)
             results['total_score'] += score
+            
+            # Pre-aggregated counts so views don't re-walk the details
+            if is_correct:
+                results['n_correct'] += 1
+            elif score > 0:
+                results['n_partial'] += 1
+            else:
+                results['n_incorrect'] += 1
         
         # Calculate percentage
         if results['max_score'] > 0:
@@ -0,0 +1,48 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs the real app against an in-memory dataset with more tags than
+# MAX_TAG_OPTIONS, so the searchable topic multiselect is used
+LARGE_TAGS_APP = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+
+import app
+from models import Question, QuestionDataset
+
+tags = [f"tag{{i:03d}}" for i in range(300)]
+questions = tuple(
+    Question(f"Question {{i}}?", ["a", "b"], ["a"], "single", [tag])
+    for i, tag in enumerate(tags)
+)
+dataset = QuestionDataset(
+    questions=questions,
+    tags=tuple(tags),
+    tag_index={{tag: (i,) for i, tag in enumerate(tags)}}
+)
+
+app.load_dataset = lambda filepath: dataset
+app.main()
+"""
+
+
+def test_topic_selection_survives_reruns_and_search():
+    at = AppTest.from_string(LARGE_TAGS_APP, default_timeout=30).run()
+    
+    at.sidebar.multiselect[0].set_value(["tag150"]).run()
+    at.run()
+    assert at.sidebar.multiselect[0].value == ["tag150"]
+    
+    # Searching for other topics keeps the earlier pick selectable and selected
+    at.sidebar.text_input[0].set_value("tag29").run()
+    topics = at.sidebar.multiselect[0]
+    assert topics.value == ["tag150"]
+    assert topics.options == ["tag150", "tag290", "tag291", "tag292", "tag293",
+                              "tag294", "tag295", "tag296", "tag297", "tag298", "tag299"]
+    
+    topics.set_value(["tag150", "tag295"]).run()
+    at.sidebar.text_input[0].set_value("").run()
+    assert at.sidebar.multiselect[0].value == ["tag150", "tag295"]
@@ -0,0 +1,113 @@
+import itertools
+import os
+
+import pytest
+
+from models import Question, QuestionDataset, QuizCorrector
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def single():
+    return Question("Q?", ["a", "b", "c"], ["b"], "single", [])
+
+
+def multiple():
+    return Question("Q?", ["a", "b", "c", "d"], ["a", "b", "c"], "multiple", [])
+
+
+def test_single_choice_hit_and_miss():
+    assert single().score_and_check("b") == (1.0, True)
+    assert single().score_and_check("a") == (0.0, False)
+
+
+@pytest.mark.parametrize("selected", [None, []])
+def test_no_answer_scores_zero(selected):
+    assert single().score_and_check(selected) == (0.0, False)
+    assert multiple().score_and_check(selected) == (0.0, False)
+
+
+def test_multiple_choice_full_and_partial_credit():
+    assert multiple().score_and_check(["c", "a", "b"]) == (1.0, True)
+    
+    score, is_correct = multiple().score_and_check(["a", "b", "d"])
+    assert score == pytest.approx(2 / 3 - 1 / 3)
+    assert not is_correct
+
+
+def test_multiple_choice_score_is_clamped_to_zero():
+    question = Question("Q?", ["a", "b", "c"], ["a"], "multiple", [])
+    
+    assert question.score_and_check(["b", "c"]) == (0.0, False)
+    assert question.score_and_check(["a", "b", "c"]) == (0.0, False)
+
+
+def test_answers_outside_choices_count_as_incorrect():
+    question = Question("Q?", ["a", "b", "c"], ["a", "b"], "multiple", [])
+    
+    assert question.score_and_check(["a", "b", "z"]) == (0.5, False)
+    assert question.score_and_check(["a", "b", "z", "z"]) == (0.5, False)
+
+
+def test_empty_correct_list_never_scores():
+    question = Question("Q?", ["a", "b"], [], "multiple", [])
+    
+    assert question.score_and_check([]) == (0.0, True)
+    assert question.score_and_check(["a"]) == (0.0, False)
+
+
+def test_calculate_score_and_is_correct_match_score_and_check():
+    question = multiple()
+    
+    assert question.calculate_score(["a", "b", "d"]) == question.score_and_check(["a", "b", "d"])[0]
+    assert question.is_correct(["a", "b", "c"]) is True
+
+
+def test_correct_quiz_aggregates_counts():
+    questions = [single(), single(), multiple(), multiple()]
+    user_answers = {0: "b", 1: "c", 2: ["a", "b", "d"]}  # question 3 unanswered
+    
+    results = QuizCorrector(questions).correct_quiz(user_answers)
+    
+    assert (results['n_correct'], results['n_partial'], results['n_incorrect']) == (1, 1, 2)
+    assert results['n_correct'] + results['n_partial'] + results['n_incorrect'] == results['max_score']
+    assert results['total_score'] == pytest.approx(1 + 1 / 3)
+    assert results['percentage'] == pytest.approx((1 + 1 / 3) / 4 * 100)
+    assert [d['is_correct'] for d in results['details']] == [True, False, False, False]
+    assert results['details'][3]['user_answers'] == []
+
+
+def reference_score(question, selected):
+    """Original set-based scoring, used as the oracle for the bitmask path."""
+    if question.mode == 'single':
+        is_correct = selected == question.correct[0] if selected else False
+        return (1.0 if is_correct else 0.0), is_correct
+    
+    selected_set = set(selected)
+    correct_set = set(question.correct)
+    if not selected:
+        return 0.0, selected_set == correct_set
+    
+    correct_selected = len(selected_set & correct_set)
+    incorrect_selected = len(selected_set - correct_set)
+    score = (correct_selected / len(correct_set)) - (incorrect_selected / len(correct_set))
+    return max(0.0, score), selected_set == correct_set
+
+
+def test_dataset_scores_match_set_based_formula():
+    dataset = QuestionDataset.from_json(os.path.join(ROOT, "quiz_dataset.json"))
+    assert dataset.questions
+    
+    for question in dataset.questions:
+        options = question.choices + ["not a choice"]
+        if question.mode == 'single':
+            selections = options + [None]
+        else:
+            selections = [list(combo) for r in range(len(options) + 1)
+                          for combo in itertools.combinations(options, r)]
+        
+        for selected in selections:
+            score, is_correct = question.score_and_check(selected)
+            expected_score, expected_correct = reference_score(question, selected)
+            assert score == pytest.approx(expected_score), (question, selected)
+            assert is_correct == expected_correct, (question, selected)